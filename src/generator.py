@@ -8,11 +8,13 @@ counterclockwise). Optionally produces a short video by interpolating the
 rotation.
 """
 
-import random
+import os
 import math
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair
 from core.video_utils import VideoGenerator
@@ -21,20 +23,65 @@ from .prompts import get_prompt
 
 
 SHAPES = ["circle", "square", "triangle", "ellipse"]
+# Colors are resolved to RGB tuples once so PIL does not parse names on every draw call
 PALETTE = [
-    "red", "blue", "green", "orange",
-    "purple", "cyan", "yellow", "magenta",
+    ImageColor.getrgb(name) for name in (
+        "red", "blue", "green", "orange",
+        "purple", "cyan", "yellow", "magenta",
+    )
 ]
 
-
-def _rotate_point(x, y, cx, cy, angle_rad):
-    dx = x - cx
-    dy = y - cy
-    cos_a = math.cos(angle_rad)
-    sin_a = math.sin(angle_rad)
-    rx = dx * cos_a - dy * sin_a
-    ry = dx * sin_a + dy * cos_a
-    return cx + rx, cy + ry
+# Unit circle sampled every 10 degrees; circles and ellipses scale this table
+_UNIT_T = np.radians(np.arange(0, 360, 10))
+_UNIT_CIRCLE = np.stack([np.cos(_UNIT_T), np.sin(_UNIT_T)], axis=1).astype(np.float32)
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on, honouring CPU affinity where supported."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _unit_points(o: dict) -> np.ndarray:
+    """Outline of an object as an (N, 2) array centered at the origin, in units of its size."""
+    shape = o["shape"]
+    if shape == "circle":
+        # Circle: approximate as many points on perimeter
+        return _UNIT_CIRCLE * 0.5
+    if shape == "square":
+        pts = np.array([(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)], dtype=np.float32)
+    elif shape == "triangle":
+        pts = np.array([(0.0, -0.5), (-0.5, 0.5), (0.5, 0.5)], dtype=np.float32)
+    elif shape == "ellipse":
+        # Ellipse: approximate as points on the perimeter
+        pts = _UNIT_CIRCLE * (0.5, 0.3)
+    else:  # polygon
+        # Use pre-generated vertices to ensure consistency
+        pts = np.asarray(o.get("polygon_verts", []), dtype=np.float32) / o["size"]
+
+    # Ensure the vertex centroid sits at the origin
+    return (pts - pts.mean(axis=0)).astype(np.float32)
+
+
+def _exact_cos_sin(angles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """cos/sin of each angle, exact at multiples of 90 degrees (where rotation only swaps/negates axes)."""
+    cos_t, sin_t = np.cos(angles), np.sin(angles)
+    quarter_turns = angles / (np.pi / 2)
+    nearest = np.rint(quarter_turns)
+    exact = np.abs(quarter_turns - nearest) < 1e-9
+    k = nearest[exact].astype(int) % 4
+    cos_t[exact] = np.array([1.0, 0.0, -1.0, 0.0])[k]
+    sin_t[exact] = np.array([0.0, 1.0, 0.0, -1.0])[k]
+    return cos_t, sin_t
+
+
+def _rotate_outlines(objects: list[dict], templates: list[np.ndarray], angles: np.ndarray) -> list[np.ndarray]:
+    """Rotate each object's scaled template by every angle at once: one (T, N, 2) array per object."""
+    cos_t, sin_t = (v.astype(np.float32) for v in _exact_cos_sin(np.asarray(angles, dtype=np.float64)))
+    # (T, 2, 2) stack of rotation matrices [[cos, -sin], [sin, cos]]
+    R = np.stack([np.stack([cos_t, -sin_t], axis=-1), np.stack([sin_t, cos_t], axis=-1)], axis=1)
+    return [np.einsum("tij,nj->tni", R, tpl * o["size"]) for o, tpl in zip(objects, templates)]
 
 
 class TaskGenerator(BaseGenerator):
@@ -44,45 +91,84 @@ class TaskGenerator(BaseGenerator):
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
 
+        # One frame-rendering pool for the generator's lifetime, sized to the CPUs this process
+        # may actually run on. Only part of a frame runs without the GIL (convert and
+        # alpha_composite; ImageDraw rasterization holds it), so with a single CPU a pool
+        # only adds overhead and frames are rendered serially instead.
+        workers = _available_cpus()
+        self._frame_pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        # Seeded like the global RNGs in BaseGenerator so datasets stay reproducible
+        self._rng = np.random.default_rng(config.random_seed)
+
+        # Blank canvas shared by all frames; copying it is a single memcpy. It is RGBA so
+        # the annotation overlay can use alpha_composite's fast path
+        self._base_buf = Image.new("RGBA", config.image_size, (255, 255, 255, 255))
+
+        # Resolve fonts once instead of hitting the filesystem on every frame
+        self._small_font = self._load_font(["DejaVuSans.ttf"], 14)
+        self._title_font = self._load_font([
+            "/System/Library/Fonts/Helvetica.ttc",
+            "/System/Library/Fonts/Supplemental/Arial.ttf",
+            "/Library/Fonts/Arial.ttf",
+            "DejaVuSans.ttf",
+        ], 24)
+
+    @staticmethod
+    def _load_font(font_paths: list[str], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+        """Return the first loadable TrueType font, falling back to PIL's default."""
+        for font_path in font_paths:
+            try:
+                return ImageFont.truetype(font_path, size)
+            except OSError:
+                continue
+        return ImageFont.load_default()
+
     def generate_task_pair(self, task_id: str) -> TaskPair:
-        # Sample objects (each object will rotate around its own geometric center)
-        num_objects = random.randint(1, 5)
+        # Sample objects (each object will rotate around its own geometric center).
+        # All per-object randomness is drawn in a few batched calls up front.
+        rng = self._rng
+        num_objects = int(rng.integers(1, 6))
         w, h = self.config.image_size
 
+        shape_choices = SHAPES + ["polygon"]  # allow irregular polygons
+        shape_idx = rng.integers(len(shape_choices), size=num_objects)
+        color_idx = rng.integers(len(PALETTE), size=num_objects)
+        sizes = rng.integers(int(min(w, h) * 0.06), int(min(w, h) * 0.22) + 1, size=num_objects)
+        # Place centers randomly but biased near center
+        offsets_x = rng.integers(-int(w * 0.25), int(w * 0.25) + 1, size=num_objects)
+        offsets_y = rng.integers(-int(h * 0.25), int(h * 0.25) + 1, size=num_objects)
+        # Irregular polygons use up to 8 vertices; unused columns are ignored
+        num_verts = rng.integers(4, 9, size=num_objects)
+        vert_jitter = rng.uniform(-0.3, 0.3, size=(num_objects, 8))
+        vert_radius = rng.uniform(0.35, 0.95, size=(num_objects, 8))
+
         objects = []
         for i in range(num_objects):
-            shape = random.choice(SHAPES + ["polygon"])  # allow irregular polygons
-            color = random.choice(PALETTE)
-            size = random.randint(int(min(w, h) * 0.06), int(min(w, h) * 0.22))
-
-            # Place centers randomly but biased near center
-            cx = int(w * 0.5 + random.randint(-int(w * 0.25), int(w * 0.25)))
-            cy = int(h * 0.5 + random.randint(-int(h * 0.25), int(h * 0.25)))
+            shape = shape_choices[shape_idx[i]]
+            size = int(sizes[i])
+            cx = int(w * 0.5 + offsets_x[i])
+            cy = int(h * 0.5 + offsets_y[i])
 
             obj = {
                 "shape": shape,
-                "color": color,
+                "color": PALETTE[color_idx[i]],
                 "size": size,
                 "center": (cx, cy),
             }
-            
+
             # Pre-generate polygon vertices for irregular shapes to ensure consistency
             if shape == "polygon":
-                verts = []
-                num_verts = random.randint(4, 8)
-                for k in range(num_verts):
-                    ang = 2 * math.pi * k / num_verts + random.uniform(-0.3, 0.3)
-                    radius = random.uniform(size * 0.35, size * 0.95)
-                    x = cx + math.cos(ang) * radius
-                    y = cy + math.sin(ang) * radius
-                    verts.append((x, y))
-                obj["polygon_verts"] = verts
-            
+                n = num_verts[i]
+                ang = 2 * np.pi * np.arange(n) / n + vert_jitter[i, :n]
+                radius = size * vert_radius[i, :n]
+                obj["polygon_verts"] = np.stack([cx + np.cos(ang) * radius, cy + np.sin(ang) * radius], axis=1)
+
             objects.append(obj)
 
         # Direction and degrees
-        direction = random.choice(["clockwise", "counterclockwise"])
-        degrees = random.randint(10, 180)
+        direction = ("clockwise", "counterclockwise")[rng.integers(2)]
+        degrees = int(rng.integers(10, 181))
         # angle_deg: positive for counterclockwise, negative for clockwise (math convention)
         # But we need to reverse this so direction matches visual rotation
         angle_deg = -degrees if direction == "counterclockwise" else degrees
@@ -91,19 +177,37 @@ class TaskGenerator(BaseGenerator):
         prompt = get_prompt(objects, direction, degrees)
         self._last_prompt = prompt
 
-        # Render first and last frames (pass metadata for overlay)
-        first_image = self._render_frame(objects, None, 0.0, direction=direction, degrees=degrees)
-        final_image = self._render_frame(objects, None, math.radians(angle_deg), direction=direction, degrees=degrees)
+        # Per-object invariants: outline templates are built once per task
+        templates = [_unit_points(o) for o in objects]
+
+        # Rotate every outline for every frame up front; frame i is at angle_deg * i / steps
+        render_video = self.config.generate_videos and self.video_generator is not None
+        transition_frames = max(8, int(self.config.video_fps * 1.0))
+        steps = transition_frames if render_video else 1
+        frame_angles = np.linspace(0.0, math.radians(angle_deg), steps + 1)
+        frame_pts = _rotate_outlines(objects, templates, frame_angles)
+
+        # Arcs, arrows, degree labels and the title do not change across frames; draw them once
+        overlay = self._render_overlay(objects, direction, degrees)
+        title = self._make_title_strip(direction, degrees)
+
+        def render(i: int) -> Image.Image:
+            points = [pts[i] for pts in frame_pts]
+            return self._render_frame(objects, None, float(frame_angles[i]), direction=direction, degrees=degrees, points=points, overlay=overlay, title=title)
+
+        # Render first and last frames
+        first_image = render(0)
+        final_image = render(steps)
 
         # Generate video if possible
         video_path = None
-        if self.config.generate_videos and self.video_generator:
-            frames = []
-            transition_frames = max(8, int(self.config.video_fps * 1.0))
-            for i in range(transition_frames + 1):
-                t = i / transition_frames
-                interm_angle = math.radians(angle_deg) * t
-                frames.append(self._render_frame(objects, None, interm_angle, direction=direction, degrees=degrees))
+        if render_video:
+            # Endpoints reuse the first/final images
+            if self._frame_pool is not None:
+                interm = list(self._frame_pool.map(render, range(1, steps)))
+            else:
+                interm = [render(i) for i in range(1, steps)]
+            frames = [first_image] + interm + [final_image]
 
             temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
             temp_dir.mkdir(parents=True, exist_ok=True)
@@ -123,9 +227,55 @@ class TaskGenerator(BaseGenerator):
             ground_truth_video=video_path,
         )
 
-    def _render_frame(self, objects: list[dict], geom_center: tuple[float, float], angle_rad: float, direction: str | None = None, degrees: int | None = None) -> Image.Image:
+    def _render_frame(self, objects: list[dict], geom_center: tuple[float, float], angle_rad: float, direction: str | None = None, degrees: int | None = None, points: list[np.ndarray] | None = None, overlay: Image.Image | None = None, title: tuple[Image.Image, tuple[int, int]] | None = None) -> Image.Image:
+        if points is None:
+            templates = [_unit_points(o) for o in objects]
+            points = [pts[0] for pts in _rotate_outlines(objects, templates, np.array([angle_rad]))]
+        if overlay is None:
+            overlay = self._render_overlay(objects, direction, degrees)
+        if title is None:
+            title = self._make_title_strip(direction, degrees)
+
+        # The angle is shared by all objects in a frame; exact at quarter turns, matching the outlines
+        cos_a, sin_a = (float(v[0]) for v in _exact_cos_sin(np.array([angle_rad])))
+
+        base = self._base_buf.copy()
+        draw_main = ImageDraw.Draw(base)
+
+        # For each object, render in grid cell centered position (independent subplot)
+        for idx, (o, (cell_center_x, cell_center_y)) in enumerate(zip(objects, self._cell_centers(len(objects)))):
+            size = o["size"]
+            color = o["color"]
+            shape = o["shape"]
+
+            outline = (0, 0, 0)
+            stroke = max(2, int(size * 0.06))
+
+            # Shapes are opaque, so draw them directly onto base without an alpha layer
+            if shape == "circle" or (shape == "ellipse" and (sin_a == 0 or cos_a == 0)):
+                # Circles are rotation invariant and an ellipse at a multiple of 90 degrees is
+                # still axis-aligned, so use PIL's native ellipse fill instead of the polygon
+                rx = size / 2
+                ry = size / 2 if shape == "circle" else size * 0.3
+                if cos_a == 0:
+                    rx, ry = ry, rx
+                draw_main.ellipse([cell_center_x - rx, cell_center_y - ry, cell_center_x + rx, cell_center_y + ry], fill=color, outline=outline, width=stroke)
+            else:
+                # Outline is already rotated; translate it straight into base coordinates
+                rot_pts = [tuple(p) for p in (points[idx] + (cell_center_x, cell_center_y)).tolist()]
+                draw_main.polygon(rot_pts, fill=color, outline=outline, width=stroke)
+
+        # Rotation annotations are identical on every frame of a task
+        base.alpha_composite(overlay)
+
+        # Large centered title indicating direction and angle, identical on every frame
+        strip, strip_pos = title
+        base.alpha_composite(strip, dest=strip_pos)
+
+        return base.convert("RGB")
+
+    def _cell_centers(self, num_obj: int) -> list[tuple[int, int]]:
         # Create subplot layout: arrange objects in grid to avoid overlap
-        num_obj = len(objects)
         if num_obj == 1:
             grid_cols, grid_rows = 1, 1
         elif num_obj == 2:
@@ -134,109 +284,28 @@ class TaskGenerator(BaseGenerator):
             grid_cols, grid_rows = 2, 2
         else:  # 5 objects
             grid_cols, grid_rows = 3, 2
-        
+
         w, h = self.config.image_size
         cell_w = w // grid_cols
         cell_h = h // grid_rows
-        
-        base = Image.new("RGB", (w, h), (255, 255, 255))
 
-        # For each object, render in grid cell centered position (independent subplot)
-        for idx, o in enumerate(objects):
+        centers = []
+        for idx in range(num_obj):
             # Compute cell position in grid
             cell_row = idx // grid_cols
             cell_col = idx % grid_cols
             cell_x0 = cell_col * cell_w
             cell_y0 = cell_row * cell_h
-            cell_center_x = cell_x0 + cell_w // 2
-            cell_center_y = cell_y0 + cell_h // 2
-
-            # Draw object on its own RGBA layer so we can rotate the shape itself
-            size = o["size"]
-            layer_size = max(64, size * 3)
-            layer = Image.new("RGBA", (layer_size, layer_size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(layer)
+            centers.append((cell_x0 + cell_w // 2, cell_y0 + cell_h // 2))
+        return centers
 
-            cx = layer.width // 2.0
-            cy = layer.height // 2.0
+    def _render_overlay(self, objects: list[dict], direction: str | None, degrees: int | None) -> Image.Image:
+        """Draw the rotation arc, arrowhead and degree label of every object on a transparent layer."""
+        overlay = Image.new("RGBA", self.config.image_size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
 
-            color = o["color"]
-            shape = o["shape"]
-
-            outline = "black"
-            stroke = max(2, int(size * 0.06))
-
-            cos_a = math.cos(angle_rad)
-            sin_a = math.sin(angle_rad)
-
-            # Generate points for all shapes, then rotate them uniformly
-            if shape == "circle":
-                # Circle: approximate as many points on perimeter
-                pts = []
-                for angle in range(0, 360, 10):
-                    rad = math.radians(angle)
-                    x = cx + (size // 2) * math.cos(rad)
-                    y = cy + (size // 2) * math.sin(rad)
-                    pts.append((x, y))
-            elif shape == "square":
-                pts = [
-                    (cx - size//2, cy - size//2),
-                    (cx + size//2, cy - size//2),
-                    (cx + size//2, cy + size//2),
-                    (cx - size//2, cy + size//2),
-                ]
-            elif shape == "triangle":
-                pts = [
-                    (cx, cy - size//2),
-                    (cx - size//2, cy + size//2),
-                    (cx + size//2, cy + size//2),
-                ]
-            elif shape == "ellipse":
-                # Ellipse: approximate as points on the perimeter
-                pts = []
-                major = size // 2
-                minor = int(size * 0.3)
-                for angle in range(0, 360, 10):
-                    rad = math.radians(angle)
-                    x = cx + major * math.cos(rad)
-                    y = cy + minor * math.sin(rad)
-                    pts.append((x, y))
-            elif shape == "polygon":
-                # Use pre-generated vertices to ensure consistency
-                pts = o.get("polygon_verts", [])
-
-            # For all non-circle shapes: ensure centroid is at (cx, cy)
-            if shape != "circle":
-                cx_pts = sum(p[0] for p in pts) / len(pts)
-                cy_pts = sum(p[1] for p in pts) / len(pts)
-                shift_x = cx - cx_pts
-                shift_y = cy - cy_pts
-                pts = [(x + shift_x, y + shift_y) for (x, y) in pts]
-
-            # Rotate all points around (cx, cy)
-            rot_pts = []
-            for pt_x, pt_y in pts:
-                dx = pt_x - cx
-                dy = pt_y - cy
-                rot_x = cx + dx * cos_a - dy * sin_a
-                rot_y = cy + dx * sin_a + dy * cos_a
-                rot_pts.append((rot_x, rot_y))
-
-            # Draw the rotated shape
-            if shape == "circle":
-                draw.polygon(rot_pts, fill=color)
-                draw.line(rot_pts + [rot_pts[0]], fill=outline, width=stroke)
-            elif shape == "ellipse":
-                draw.polygon(rot_pts, fill=color)
-                draw.line(rot_pts + [rot_pts[0]], fill=outline, width=stroke)
-            else:  # square, triangle, polygon
-                draw.polygon(rot_pts, fill=color)
-                draw.line(rot_pts + [rot_pts[0]], fill=outline, width=stroke)
-
-            # Paste layer onto base image centered at cell center
-            px = int(cell_center_x - layer.width / 2)
-            py = int(cell_center_y - layer.height / 2)
-            base.paste(layer, (px, py), layer)
+        for o, (cell_center_x, cell_center_y) in zip(objects, self._cell_centers(len(objects))):
+            size = o["size"]
 
             # Draw rotation arc, arrow, and degree label for this object in its cell
             r = int(max(size, 32) * 0.75) + 12
@@ -258,37 +327,38 @@ class TaskGenerator(BaseGenerator):
 
             # Draw arc
             bbox = [cell_center_x - r, cell_center_y - r, cell_center_x + r, cell_center_y + r]
-            draw_main = ImageDraw.Draw(base)
-            draw_main.arc(bbox, start=arc_start, end=arc_end, fill="black", width=max(3, int(size * 0.08)))
+            draw.arc(bbox, start=arc_start, end=arc_end, fill=(0, 0, 0), width=max(3, int(size * 0.08)))
 
-            # Arrowhead at the true end_ang (visual endpoint)
+            # Arrowhead at the true end_ang (visual endpoint); every direction below is a
+            # sign flip/swap of (cos, sin) of end_ang, so two trig calls suffice
             end_rad = math.radians(end_ang)
-            tip_x = cell_center_x + r * math.cos(end_rad)
-            tip_y = cell_center_y + r * math.sin(end_rad)
-            
+            end_c, end_s = math.cos(end_rad), math.sin(end_rad)
+            tip_x = cell_center_x + r * end_c
+            tip_y = cell_center_y + r * end_s
+
             # Tangent direction at arc end points along direction of rotation
             # Tangent is perpendicular to radius
-            # Counterclockwise motion: tangent is -90° from radius
-            # Clockwise motion: tangent is +90° from radius
+            # Counterclockwise motion: tangent is -90° from radius, i.e. (sin, -cos)
+            # Clockwise motion: tangent is +90° from radius, i.e. (-sin, cos)
             if direction == "counterclockwise":
-                tangent_ang = end_rad - math.pi / 2
+                tan_x, tan_y = end_s, -end_c
             else:  # clockwise
-                tangent_ang = end_rad + math.pi / 2
-            
+                tan_x, tan_y = -end_s, end_c
+
             # Arrowhead: tip points in tangent direction, base is back from tip
             arrow_len = 12
             arrow_width = 8
-            base_x = tip_x - arrow_len * math.cos(tangent_ang)
-            base_y = tip_y - arrow_len * math.sin(tangent_ang)
-            
-            # Perpendicular to tangent for arrow width
-            perp_ang = tangent_ang + math.pi / 2
-            corner1_x = base_x + arrow_width * math.cos(perp_ang)
-            corner1_y = base_y + arrow_width * math.sin(perp_ang)
-            corner2_x = base_x - arrow_width * math.cos(perp_ang)
-            corner2_y = base_y - arrow_width * math.sin(perp_ang)
-            
-            draw_main.polygon([(tip_x, tip_y), (corner1_x, corner1_y), (corner2_x, corner2_y)], fill="black")
+            base_x = tip_x - arrow_len * tan_x
+            base_y = tip_y - arrow_len * tan_y
+
+            # Perpendicular to tangent (tangent rotated +90°) for arrow width
+            perp_x, perp_y = -tan_y, tan_x
+            corner1_x = base_x + arrow_width * perp_x
+            corner1_y = base_y + arrow_width * perp_y
+            corner2_x = base_x - arrow_width * perp_x
+            corner2_y = base_y - arrow_width * perp_y
+
+            draw.polygon([(tip_x, tip_y), (corner1_x, corner1_y), (corner2_x, corner2_y)], fill=(0, 0, 0))
 
             # Degree label at middle of arc
             mid_ang = (start_ang + end_ang) / 2
@@ -297,42 +367,29 @@ class TaskGenerator(BaseGenerator):
             lx = cell_center_x + label_r * math.cos(mid_rad)
             ly = cell_center_y + label_r * math.sin(mid_rad)
             deg_text = f"{degrees}°" if degrees is not None else "?°"
-            
-            try:
-                small_font = ImageFont.truetype("DejaVuSans.ttf", 14)
-            except Exception:
-                small_font = ImageFont.load_default()
-            
-            tb = draw_main.textbbox((0, 0), deg_text, font=small_font)
+            tb = draw.textbbox((0, 0), deg_text, font=self._small_font)
             tw, th = tb[2] - tb[0], tb[3] - tb[1]
             rect_pad = 4
-            draw_main.rectangle([(lx - tw//2 - rect_pad, ly - th//2 - rect_pad), (lx + tw//2 + rect_pad, ly + th//2 + rect_pad)], fill=(255, 255, 255))
-            draw_main.text((lx - tw//2, ly - th//2), deg_text, fill="black", font=small_font)
+            draw.rectangle([(lx - tw//2 - rect_pad, ly - th//2 - rect_pad), (lx + tw//2 + rect_pad, ly + th//2 + rect_pad)], fill=(255, 255, 255))
+            draw.text((lx - tw//2, ly - th//2), deg_text, fill=(0, 0, 0), font=self._small_font)
 
-        # Draw a large centered title indicating direction and angle
+        return overlay
+
+    def _make_title_strip(self, direction: str | None, degrees: int | None) -> tuple[Image.Image, tuple[int, int]]:
+        """Render the title banner once; returns the strip and where to paste it on a frame."""
         w = self.config.image_size[0]
-        draw = ImageDraw.Draw(base)
-        title_font = None
-        for font_path in [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/Library/Fonts/Arial.ttf",
-            "DejaVuSans.ttf"
-        ]:
-            try:
-                title_font = ImageFont.truetype(font_path, 24)
-                break
-            except:
-                continue
-        if title_font is None:
-            title_font = ImageFont.load_default()
 
         title_dir = direction.capitalize() if direction else "Unknown"
         title_deg = f"{degrees}°" if degrees is not None else "?°"
         title_text = f"{title_dir} Rotation {title_deg}"
-        tbox = draw.textbbox((0, 0), title_text, font=title_font)
+        tbox = ImageDraw.Draw(self._base_buf).textbbox((0, 0), title_text, font=self._title_font)
         t_w, t_h = tbox[2] - tbox[0], tbox[3] - tbox[1]
-        draw.rectangle([(w//2 - t_w//2 - 8, 6), (w//2 + t_w//2 + 8, 6 + t_h + 6)], fill=(255,255,255))
-        draw.text((w//2 - t_w//2, 9), title_text, fill="black", font=title_font)
 
-        return base
+        # White box spanning (w//2 - t_w//2 - 8, 6) to (w//2 + t_w//2 + 8, 6 + t_h + 6); the strip
+        # is transparent below it so glyphs that overhang the box are kept
+        strip_w = 2 * (t_w // 2) + 17
+        strip = Image.new("RGBA", (strip_w, max(t_h + 7, tbox[3] + 4)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(strip)
+        draw.rectangle([(0, 0), (strip_w - 1, t_h + 6)], fill=(255, 255, 255))
+        draw.text((8, 3), title_text, fill=(0, 0, 0), font=self._title_font)
+        return strip, (w//2 - t_w//2 - 8, 6)